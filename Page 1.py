@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from data import load_data, mean_by, PLOTLY_CONFIG
 
 st.title("🎯 Objective 1: Stress Level Distribution")
 st.markdown("**Objective Statement:** To understand how academic stress levels vary among students.")
@@ -14,34 +16,48 @@ It identifies common stress levels, potential outliers, and patterns across demo
 """)
 
 # Load data
-DATA_URL = "https://raw.githubusercontent.com/Nashalan/Assignment-/refs/heads/main/Academic%20Stress%20Level.csv"
-@st.cache_data
-def load_data():
-    df = pd.read_csv(DATA_URL)
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-    return df
+df, stress_col, _ = load_data()
 
-df = load_data()
-df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+if not stress_col:
+    st.error("⚠️ No stress column found in dataset.")
+    st.stop()
 
-# Visualization 1: Histogram
-st.subheader("1️⃣ Stress Level Distribution")
-fig, ax = plt.subplots()
-sns.histplot(df['stress_level'], kde=True, color="skyblue", ax=ax)
-st.pyplot(fig)
+# histogram counts plus a Gaussian KDE (Scott's bandwidth) on a fixed 200-point grid;
+# the KDE is summed over 512 fine bins so memory does not grow with the row count,
+# and it is None when the data is too small or constant to have a bandwidth
+@st.cache_data
+def hist_kde(x, bins=30):
+    x = np.asarray(x.dropna(), dtype=np.float64)
+    h, e = np.histogram(x, bins)
+    xs = np.linspace(e[0], e[-1], 200)
+    if len(x) < 2 or x.std(ddof=1) == 0:
+        return h, e, xs, None
+    bw = x.std(ddof=1) * len(x) ** (-1 / 5)
+    counts, fine = np.histogram(x, 512, range=(e[0], e[-1]))
+    centers = 0.5 * (fine[:-1] + fine[1:])
+    kernel = np.exp(-0.5 * ((xs[:, None] - centers[None, :]) / bw) ** 2)
+    ys = kernel @ counts / (len(x) * bw * np.sqrt(2 * np.pi))
+    return h, e, xs, ys
 
-# Visualization 2: Boxplot
-st.subheader("2️⃣ Boxplot of Stress Levels")
-fig, ax = plt.subplots()
-sns.boxplot(x=df['stress_level'], color="lightcoral", ax=ax)
-st.pyplot(fig)
+# Visualization 1: Histogram and Boxplot in one figure sharing the stress axis
+st.subheader("1️⃣ Stress Level Distribution")
+h, e, xs, ys = hist_kde(df[stress_col])
+fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.75, 0.25])
+fig.add_trace(go.Bar(x=0.5 * (e[:-1] + e[1:]), y=h, marker_color="skyblue", name="Count"), 1, 1)
+if ys is not None:
+    # scale the density to counts so both traces share the y axis
+    ys_scaled = ys * h.sum() * (e[1] - e[0])
+    fig.add_trace(go.Scatter(x=xs, y=ys_scaled, mode="lines", name="KDE"), 1, 1)
+fig.add_trace(go.Box(x=df[stress_col], marker_color="lightcoral", name="Boxplot"), 2, 1)
+fig.update_layout(bargap=0)
+st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
 
-# Visualization 3: Pie Chart (if gender exists)
+# Visualization 2: Pie Chart (if gender exists)
 if 'gender' in df.columns:
-    st.subheader("3️⃣ Average Stress by Gender")
-    avg_stress = df.groupby('gender')['stress_level'].mean().reset_index()
-    fig = px.pie(avg_stress, names='gender', values='stress_level', title='Average Stress by Gender')
-    st.plotly_chart(fig)
+    st.subheader("2️⃣ Average Stress by Gender")
+    avg_stress = mean_by(df, 'gender', stress_col)
+    fig = px.pie(avg_stress, names='gender', values=stress_col, title='Average Stress by Gender')
+    st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
 
 st.success("""
 **Interpretation:**  
@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
+
+from data import load_data, compute_corr, plot_sample, PLOTLY_CONFIG
 
 st.title("🎓 Objective 2: Academic Factors & Stress")
 st.markdown("**Objective Statement:** To examine how academic performance and workload influence stress levels.")
@@ -14,35 +15,70 @@ Understanding these relationships helps identify whether workload and performanc
 """)
 
 # Load data
-DATA_URL = "https://raw.githubusercontent.com/Nashalan/Assignment-/refs/heads/main/Academic%20Stress%20Level.csv"
+df, stress_col, numeric_cols = load_data()
+
+if not stress_col:
+    st.error("⚠️ No stress column found in dataset.")
+    st.stop()
+
+# least-squares trendline as two endpoints, fitted once per variable on complete rows
 @st.cache_data
-def load_data():
-    df = pd.read_csv(DATA_URL)
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-    return df
+def ols_line(x, y):
+    keep = x.notna() & y.notna()
+    x, y = x[keep], y[keep]
+    b, a = np.polyfit(x, y, 1)
+    xs = np.array([x.min(), x.max()])
+    return xs, a + b * xs
 
-df = load_data()
+# points plus trendline, built once per x variable
+@st.cache_resource
+def build_trend_scatter(df, x_axis, stress_col):
+    sample = plot_sample(df, strat=stress_col)
+    xs, ys = ols_line(df[x_axis], df[stress_col])
+    fig = go.Figure([
+        go.Scattergl(x=sample[x_axis], y=sample[stress_col], mode="markers",
+                     marker_color='teal', name="Students"),
+        go.Scatter(x=xs, y=ys, mode="lines", name="OLS trend"),
+    ])
+    fig.update_layout(xaxis_title=x_axis, yaxis_title=stress_col)
+    return fig
 
-# Choose variable
-numeric_cols = df.select_dtypes(include='number').columns.tolist()
-x_axis = st.selectbox("Select an academic variable to compare with stress level:", numeric_cols, index=0)
+# pairwise scatter matrix (WebGL splom trace), built once per variable set
+@st.cache_resource
+def build_pairplot(df, cols):
+    fig = px.scatter_matrix(df, dimensions=list(cols))
+    fig.update_traces(diagonal_visible=False)
+    return fig
 
-# Visualization 1: Scatter Plot
-st.subheader(f"1️⃣ Scatter Plot: {x_axis} vs Stress Level")
-fig = px.scatter(df, x=x_axis, y='stress_level', trendline="ols", color_discrete_sequence=['teal'])
-st.plotly_chart(fig)
+# Visualization 1: Scatter Plot (fragment, so the selectbox only reruns this chart)
+@st.fragment
+def scatter_section(df, stress_col, numeric_cols):
+    x_axis = st.selectbox("Select an academic variable to compare with stress level:", numeric_cols, index=0)
+    st.subheader(f"1️⃣ Scatter Plot: {x_axis} vs Stress Level")
+    fig = build_trend_scatter(df, x_axis, stress_col)
+    st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
+
+if numeric_cols:
+    scatter_section(df, stress_col, numeric_cols)
 
 # Visualization 2: Correlation Heatmap
 st.subheader("2️⃣ Correlation Heatmap")
-fig, ax = plt.subplots(figsize=(8,6))
-sns.heatmap(df.corr(), annot=True, cmap='coolwarm', ax=ax)
-st.pyplot(fig)
+corr_matrix = compute_corr(df.select_dtypes(include="number"))
+fig = px.imshow(corr_matrix, text_auto=".2f", aspect="auto", color_continuous_scale="RdBu_r",
+                zmin=-1, zmax=1)
+st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
+
+# Visualization 3: Pairplot (only rendered on request; the fragment keeps the toggle from rerunning the page)
+@st.fragment
+def pairplot_section(df, cols):
+    with st.expander("Show pairplot (slow)", expanded=False):
+        if st.checkbox("Render pairplot", key="pairplot_open"):
+            fig = build_pairplot(df, cols)
+            st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
 
-# Visualization 3: Pairplot
-academic_vars = [c for c in ['gpa', 'study_hours', 'stress_level'] if c in df.columns]
+academic_vars = [c for c in ['gpa', 'study_hours', stress_col] if c in df.columns]
 if len(academic_vars) >= 2:
-    sns.pairplot(df[academic_vars], diag_kind="kde")
-    st.pyplot(plt.gcf())
+    pairplot_section(df, tuple(academic_vars))
 
 st.success("""
 **Interpretation:**  
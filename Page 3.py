@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import plotly.express as px
+import plotly.graph_objects as go
+
+from data import load_data, plot_sample, PLOTLY_CONFIG
 
 st.title("💤 Objective 3: Lifestyle Factors & Stress")
 st.markdown("**Objective Statement:** To explore how sleep and physical activity influence stress levels.")
@@ -14,34 +14,45 @@ Healthy routines, such as proper sleep and regular exercise, may help lower stre
 """)
 
 # Load data
-DATA_URL = "https://raw.githubusercontent.com/Nashalan/Assignment-/refs/heads/main/Academic%20Stress%20Level.csv"
-@st.cache_data
-def load_data():
-    df = pd.read_csv(DATA_URL)
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-    return df
+df, stress_col, _ = load_data()
+
+if not stress_col:
+    st.error("⚠️ No stress column found in dataset.")
+    st.stop()
 
-df = load_data()
+# 3D scatter capped at 1500 points with small markers to keep WebGL responsive
+@st.cache_resource
+def fig_scatter3d(df, stress_col):
+    sample = plot_sample(df, n=1500, strat=stress_col)
+    fig = go.Figure(go.Scatter3d(x=sample['sleep_duration'], y=sample['physical_activity'], z=sample[stress_col],
+                                 mode="markers", marker=dict(size=2, color=sample[stress_col], showscale=True)))
+    fig.update_layout(scene=dict(xaxis_title='sleep_duration', yaxis_title='physical_activity', zaxis_title=stress_col))
+    return fig
 
 # Visualization 1: Sleep vs Stress
 if 'sleep_duration' in df.columns:
     st.subheader("1️⃣ Sleep Duration vs Stress Level")
-    fig = px.scatter(df, x='sleep_duration', y='stress_level', color='sleep_duration',
-                     color_continuous_scale='viridis')
-    st.plotly_chart(fig)
+    fig = px.scatter(plot_sample(df, strat=stress_col), x='sleep_duration', y=stress_col, color='sleep_duration',
+                     color_continuous_scale='viridis', render_mode="webgl")
+    st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
 
 # Visualization 2: Physical Activity vs Stress
 if 'physical_activity' in df.columns:
     st.subheader("2️⃣ Stress Level by Physical Activity")
-    fig, ax = plt.subplots()
-    sns.boxplot(x='physical_activity', y='stress_level', data=df, palette='coolwarm', ax=ax)
-    st.pyplot(fig)
-
-# Visualization 3: 3D Plot
-if all(c in df.columns for c in ['sleep_duration', 'physical_activity', 'stress_level']):
+    fig = px.box(df, x='physical_activity', y=stress_col, color='physical_activity')
+    st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
+
+# Visualization 3: 3D Plot (only rendered on request; the fragment keeps the toggle from rerunning the page)
+@st.fragment
+def scatter3d_section(df, stress_col):
+    with st.expander("Show 3D plot (slow)", expanded=False):
+        if st.checkbox("Render 3D plot", key="scatter3d_open"):
+            fig = fig_scatter3d(df, stress_col)
+            st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG)
+
+if all(c in df.columns for c in ['sleep_duration', 'physical_activity']):
     st.subheader("3️⃣ 3D Plot: Sleep, Activity & Stress")
-    fig = px.scatter_3d(df, x='sleep_duration', y='physical_activity', z='stress_level', color='stress_level')
-    st.plotly_chart(fig)
+    scatter3d_section(df, stress_col)
 
 st.success("""
 **Interpretation:**  
@@ -1,7 +1,8 @@
 # app.py
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+import numpy as np
+
+from data import load_data, compute_corr, mean_by, plot_sample, PLOTLY_CONFIG
 
 # ---------------------------------------------------
 # CONFIGURATION
@@ -11,38 +12,80 @@ st.set_page_config(page_title="Academic Stress Visualization", layout="wide")
 # ---------------------------------------------------
 # LOAD DATA
 # ---------------------------------------------------
-DATA_URL = "https://raw.githubusercontent.com/Nashalan/Assignment-/refs/heads/main/Academic%20Stress%20Level.csv"
+df, stress_col, numeric_cols = load_data()
 
+# cached aggregations reused across reruns
 @st.cache_data
-def load_data():
-    df = pd.read_csv(DATA_URL)
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-    return df
-
-df = load_data()
+def sorted_by(df, key):
+    return df.sort_values(key)
 
-# detect stress column automatically
-def get_stress_column(df):
-    for c in df.columns:
-        if "stress" in c.lower():
-            return c
-    return None
+# average stress and its recommendation bucket
+@st.cache_data
+def recommendation(df, col):
+    v = float(df[col].mean())
+    bucket = "high" if v > 6 else "mod" if v >= 4 else "low"
+    return v, bucket
 
-stress_col = get_stress_column(df)
+# ---------------------------------------------------
+# CACHED FIGURES
+# ---------------------------------------------------
+# plotly is imported inside the builders so pages without charts never load it
+@st.cache_resource
+def fig_hist(df, col):
+    import plotly.graph_objects as go
+    # bin server-side so only the bar counts are sent to the browser
+    counts, edges = np.histogram(df[col].dropna().to_numpy(), bins=20)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    fig = go.Figure(go.Bar(x=centers, y=counts, marker_color="#4FC3F7"))
+    fig.update_layout(title="Distribution of Stress Levels", xaxis_title="Stress Level",
+                      yaxis_title="Number of Students", bargap=0)
+    return fig
+
+@st.cache_resource
+def fig_bar_gender(df, col, title):
+    import plotly.express as px
+    return px.bar(mean_by(df, "gender", col), x="gender", y=col, color="gender", title=title)
+
+@st.cache_resource
+def fig_line_age(df, col):
+    import plotly.express as px
+    return px.line(sorted_by(df, "age"), x="age", y=col, title="Stress Level by Age", markers=True)
+
+@st.cache_resource
+def fig_bar_course(df, col):
+    import plotly.express as px
+    return px.bar(mean_by(df, "course_load", col), x="course_load", y=col, color=col,
+                  color_continuous_scale="Tealgrn", title="Average Stress by Course Load")
+
+@st.cache_resource
+def fig_corr_bar(corr_matrix, col):
+    import plotly.express as px
+    corr = corr_matrix[col].sort_values(ascending=False).reset_index()
+    corr.columns = ['Variable', 'Correlation with Stress']
+    return px.bar(corr, x='Variable', y='Correlation with Stress', color='Correlation with Stress',
+                  color_continuous_scale='RdBu', title="Correlation of Academic Factors with Stress")
+
+@st.cache_resource
+def fig_scatter(df, x_var, col):
+    import plotly.express as px
+    return px.scatter(plot_sample(df, strat=col), x=x_var, y=col, render_mode="webgl",
+                      color=col, color_continuous_scale="Viridis",
+                      title=f"{x_var.replace('_',' ').title()} vs Stress Level")
 
 # ---------------------------------------------------
-# SIDEBAR MENU
+# FRAGMENTS
 # ---------------------------------------------------
-st.sidebar.title("📊 Academic Stress Dashboard")
-page = st.sidebar.radio(
-    "Navigate to:",
-    ["🏠 Home", "🎯 Stress Overview", "🎓 Academic Factors", "💡 Stress Management & Recommendations"]
-)
+# only the scatter depends on the selectbox, so only it reruns when it changes
+@st.fragment
+def scatter_section(df, stress_col, num_cols):
+    x_var = st.selectbox("Select an Academic Variable to Compare with Stress:", num_cols)
+    fig_scat = fig_scatter(df, x_var, stress_col)
+    st.plotly_chart(fig_scat, width="stretch", config=PLOTLY_CONFIG)
 
 # ---------------------------------------------------
 # PAGE 1 — HOME
 # ---------------------------------------------------
-if page == "🏠 Home":
+def home():
     st.title("🏫 Academic Stress Level Dashboard")
     st.markdown("""
     Welcome to the **Academic Stress Visualization Dashboard**!  
@@ -62,7 +105,7 @@ if page == "🏠 Home":
 # ---------------------------------------------------
 # PAGE 2 — STRESS OVERVIEW
 # ---------------------------------------------------
-elif page == "🎯 Stress Overview":
+def stress_overview():
     st.title("🎯 Stress Level Distribution and Overview")
 
     st.markdown("### 🎯 Objective")
@@ -76,23 +119,18 @@ elif page == "🎯 Stress Overview":
 
     if stress_col:
         # Histogram
-        fig1 = px.histogram(df, x=stress_col, nbins=20, title="Distribution of Stress Levels",
-                            color_discrete_sequence=["#4FC3F7"])
-        fig1.update_layout(xaxis_title="Stress Level", yaxis_title="Number of Students")
-        st.plotly_chart(fig1, use_container_width=True)
+        fig1 = fig_hist(df, stress_col)
+        st.plotly_chart(fig1, width="stretch", config=PLOTLY_CONFIG)
 
         # Stress by gender
         if "gender" in df.columns:
-            avg_stress_gender = df.groupby("gender")[stress_col].mean().reset_index()
-            fig2 = px.bar(avg_stress_gender, x="gender", y=stress_col, color="gender",
-                          title="Average Stress by Gender")
-            st.plotly_chart(fig2, use_container_width=True)
+            fig2 = fig_bar_gender(df, stress_col, "Average Stress by Gender")
+            st.plotly_chart(fig2, width="stretch", config=PLOTLY_CONFIG)
 
         # Stress by age (if available)
         if "age" in df.columns:
-            fig3 = px.line(df.sort_values("age"), x="age", y=stress_col,
-                           title="Stress Level by Age", markers=True)
-            st.plotly_chart(fig3, use_container_width=True)
+            fig3 = fig_line_age(df, stress_col)
+            st.plotly_chart(fig3, width="stretch", config=PLOTLY_CONFIG)
 
         st.markdown("### 💬 Interpretation")
         st.success("""
@@ -105,7 +143,7 @@ elif page == "🎯 Stress Overview":
 # ---------------------------------------------------
 # PAGE 3 — ACADEMIC FACTORS
 # ---------------------------------------------------
-elif page == "🎓 Academic Factors":
+def academic_factors():
     st.title("🎓 Academic Factors Affecting Stress")
 
     st.markdown("### 🎯 Objective")
@@ -118,23 +156,14 @@ elif page == "🎓 Academic Factors":
     """)
 
     if stress_col:
-        numeric_cols = df.select_dtypes(include="number").columns.tolist()
-
         # Correlation with stress
-        corr = df[numeric_cols].corr()[stress_col].sort_values(ascending=False).reset_index()
-        corr.columns = ['Variable', 'Correlation with Stress']
-        fig_corr = px.bar(corr, x='Variable', y='Correlation with Stress', color='Correlation with Stress',
-                          color_continuous_scale='RdBu', title="Correlation of Academic Factors with Stress")
-        st.plotly_chart(fig_corr, use_container_width=True)
+        corr_matrix = compute_corr(df.select_dtypes(include="number"))
+        fig_corr = fig_corr_bar(corr_matrix, stress_col)
+        st.plotly_chart(fig_corr, width="stretch", config=PLOTLY_CONFIG)
 
         # Scatter plot to compare stress with selected variable
-        num_cols = [col for col in numeric_cols if col != stress_col]
-        if num_cols:
-            x_var = st.selectbox("Select an Academic Variable to Compare with Stress:", num_cols)
-            fig_scat = px.scatter(df, x=x_var, y=stress_col,
-                                  color=stress_col, color_continuous_scale="Viridis",
-                                  title=f"{x_var.replace('_',' ').title()} vs Stress Level")
-            st.plotly_chart(fig_scat, use_container_width=True)
+        if numeric_cols:
+            scatter_section(df, stress_col, numeric_cols)
 
         st.markdown("### 💬 Interpretation")
         st.success("""
@@ -148,7 +177,7 @@ elif page == "🎓 Academic Factors":
 # ---------------------------------------------------
 # PAGE 4 — STRESS MANAGEMENT & RECOMMENDATIONS
 # ---------------------------------------------------
-elif page == "💡 Stress Management & Recommendations":
+def stress_management():
     st.title("💡 Stress Management & Recommendations")
 
     st.markdown("### 🎯 Objective")
@@ -161,34 +190,30 @@ elif page == "💡 Stress Management & Recommendations":
     """)
 
     if stress_col:
-        avg_stress = df[stress_col].mean()
+        avg_stress, bucket = recommendation(df, stress_col)
         st.metric("📈 Average Stress Level", f"{avg_stress:.2f}")
 
         # Stress by gender (if available)
         if "gender" in df.columns:
-            avg_stress_gender = df.groupby("gender")[stress_col].mean().reset_index()
-            fig1 = px.bar(avg_stress_gender, x="gender", y=stress_col, color="gender",
-                          title="Average Stress Level by Gender")
-            st.plotly_chart(fig1, use_container_width=True)
+            fig1 = fig_bar_gender(df, stress_col, "Average Stress Level by Gender")
+            st.plotly_chart(fig1, width="stretch", config=PLOTLY_CONFIG)
 
         # Stress by course load (if available)
         if "course_load" in df.columns:
-            avg_stress_course = df.groupby("course_load")[stress_col].mean().reset_index()
-            fig2 = px.bar(avg_stress_course, x="course_load", y=stress_col, color=stress_col,
-                          color_continuous_scale="Tealgrn", title="Average Stress by Course Load")
-            st.plotly_chart(fig2, use_container_width=True)
+            fig2 = fig_bar_course(df, stress_col)
+            st.plotly_chart(fig2, width="stretch", config=PLOTLY_CONFIG)
 
         # Dynamic recommendations
         st.markdown("### 🧘 Recommendations for Managing Academic Stress")
 
-        if avg_stress > 6:
+        if bucket == "high":
             st.warning("""
             🔺 **High Stress Detected**
             - Prioritize adequate rest and regular exercise.
             - Use relaxation apps (like Headspace or Calm) for guided mindfulness.
             - Talk to trusted mentors, counselors, or peers for support.
             """)
-        elif 4 <= avg_stress <= 6:
+        elif bucket == "mod":
             st.info("""
             ⚖️ **Moderate Stress Levels**
             - Maintain a structured study schedule with frequent short breaks.
@@ -210,3 +235,17 @@ elif page == "💡 Stress Management & Recommendations":
         """)
     else:
         st.error("⚠️ No stress column found in dataset.")
+
+# ---------------------------------------------------
+# SIDEBAR MENU
+# ---------------------------------------------------
+PAGES = {
+    "🏠 Home": home,
+    "🎯 Stress Overview": stress_overview,
+    "🎓 Academic Factors": academic_factors,
+    "💡 Stress Management & Recommendations": stress_management,
+}
+
+st.sidebar.title("📊 Academic Stress Dashboard")
+page = st.sidebar.radio("Navigate to:", list(PAGES))
+PAGES[page]()
@@ -0,0 +1,140 @@
+import functools
+import hashlib
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+# ---------------------------------------------------
+# SHARED CHART SETTINGS
+# ---------------------------------------------------
+# hide Plotly's mode bar so the browser skips binding its toolbar on every render
+PLOTLY_CONFIG = {"displayModeBar": False, "responsive": True}
+
+# ---------------------------------------------------
+# SHARED DATA LOADING
+# ---------------------------------------------------
+DATA_URL = "https://raw.githubusercontent.com/Nashalan/Assignment-/refs/heads/main/Academic%20Stress%20Level.csv"
+
+# parse-time dtypes for known columns (by normalized name); numeric ones may still be
+# narrowed by the downcast below, and age is nullable so blank values load as <NA>;
+# group keys are categoricals so groupby works on integer codes
+COLUMN_DTYPES = {
+    "gender": "category",
+    "course_load": "category",
+    "stress_level": "float32",
+    "age": "Int16",
+    "sleep_duration": "float32",
+    "physical_activity": "category",
+}
+
+# cleaned copy of the CSV, written on first load so new sessions skip the download and parse;
+# the filename carries a hash of COLUMN_DTYPES so a dtype change never reads an old file
+SCHEMA_TAG = hashlib.sha1(repr(sorted(COLUMN_DTYPES.items())).encode()).hexdigest()[:8]
+CACHE_PATH = Path(__file__).parent / "_cache" / f"stress-{SCHEMA_TAG}.parquet"
+# how long the in-memory and on-disk copies are trusted before refetching
+CACHE_TTL = timedelta(hours=24)
+
+def normalize_column(c):
+    return c.strip().lower().replace(" ", "_")
+
+# categoricals from the pyarrow parser can carry nullable (e.g. Int64) categories, which
+# Parquet reads back as plain columns, or as float categories when values are missing;
+# rebuild them on NumPy-backed (integer where integral) categories so cold and warm
+# loads agree on dtypes
+def restore_categories(df):
+    for c, t in COLUMN_DTYPES.items():
+        if t != "category" or c not in df.columns:
+            continue
+        col = df[c] if isinstance(df[c].dtype, pd.CategoricalDtype) else df[c].astype("category")
+        cats = col.cat.categories
+        if hasattr(cats.dtype, "numpy_dtype"):
+            cats = pd.Index(cats.to_numpy(dtype=cats.dtype.numpy_dtype))
+        if cats.dtype.kind == "f" and (cats == cats.round()).all():
+            cats = cats.astype("int64")
+        df[c] = col.cat.rename_categories(cats)
+    return df
+
+def read_dataset():
+    if CACHE_PATH.exists() and time.time() - CACHE_PATH.stat().st_mtime < CACHE_TTL.total_seconds():
+        return restore_categories(pd.read_parquet(CACHE_PATH))
+    header = pd.read_csv(DATA_URL, nrows=0).columns
+    dtype = {c: COLUMN_DTYPES[normalize_column(c)] for c in header
+             if normalize_column(c) in COLUMN_DTYPES}
+    # Arrow's multi-threaded CSV reader, still producing NumPy-backed columns
+    df = pd.read_csv(DATA_URL, dtype=dtype, engine="pyarrow")
+    df.columns = [normalize_column(c) for c in df.columns]
+    # narrow the remaining numeric dtypes to cut memory traffic in corr/groupby
+    for c in df.select_dtypes("number"):
+        df[c] = pd.to_numeric(df[c], downcast="integer" if pd.api.types.is_integer_dtype(df[c]) else "float")
+    df = restore_categories(df)
+    write_cache(df)
+    return df
+
+# write to a temp file and rename into place so readers never see a partial file;
+# the cache is best effort, so a read-only deploy just skips it
+def write_cache(df):
+    tmp = None
+    try:
+        CACHE_PATH.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_PATH.parent, suffix=".tmp")
+        os.close(fd)
+        df.to_parquet(tmp)
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+# data plus the stress column and the other numeric columns, memoized together
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_data():
+    df = read_dataset()
+    stress_col = get_stress_column(tuple(df.columns))
+    numeric_cols = [c for c in df.select_dtypes("number").columns if c != stress_col]
+    return df, stress_col, numeric_cols
+
+# detect stress column automatically, memoized per process on the tuple of column names
+@functools.lru_cache(maxsize=4)
+def get_stress_column(cols):
+    mask = pd.Index(cols).str.contains("stress", case=False)
+    idx = np.flatnonzero(mask)
+    return cols[idx[0]] if idx.size else None
+
+# full correlation matrix of a numeric frame, computed once per data version
+# with np.corrcoef on a contiguous float32 buffer; np.corrcoef spreads NaN across
+# whole rows, so frames with missing values use pandas' pairwise-complete corr
+@st.cache_data
+def compute_corr(df_num):
+    if df_num.isna().to_numpy().any():
+        return df_num.corr()
+    arr = np.ascontiguousarray(df_num.to_numpy(dtype=np.float32))
+    corr = np.corrcoef(arr, rowvar=False)
+    return pd.DataFrame(corr, index=df_num.columns, columns=df_num.columns)
+
+# group means for the pie and bar charts; observed=True skips unused categories
+@st.cache_data
+def mean_by(df, key, target):
+    return df.groupby(key, observed=True)[target].mean().reset_index()
+
+# cap the rows sent to interactive charts, optionally stratified on a column
+# so the sample keeps its distribution; every stratum (NaN included) keeps at
+# least one row, and a near-continuous column falls back to a plain sample
+@st.cache_data
+def plot_sample(df, n=2000, strat=None):
+    if len(df) <= n:
+        return df
+    if strat is None or df[strat].nunique(dropna=False) > n // 2:
+        return df.sample(n, random_state=0)
+    shuffled = df.sample(frac=1, random_state=0)
+    groups = shuffled.groupby(strat, observed=True, dropna=False, sort=False)
+    codes = groups.ngroup().to_numpy()
+    quota = np.maximum(1, np.bincount(codes) * n // len(df))
+    return shuffled[groups.cumcount().to_numpy() < quota[codes]]